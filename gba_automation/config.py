@@ -5,7 +5,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 _ENV_EMULATOR_PATH = "GBA_AUTOMATION_EMULATOR"
 _ENV_ROM_PATH = "GBA_AUTOMATION_ROM"
@@ -41,27 +41,43 @@ class AppConfig:
 
         Returns:
             A fully resolved :class:`AppConfig` instance.
+
+        Raises:
+            FileNotFoundError: If any of the paths is missing. The message lists every
+                missing path so they can all be fixed in one go.
         """
 
         root = project_root or Path.cwd()
+        errors: List[str] = []
+
+        def resolve(explicit: Optional[str], **kwargs: Any) -> Optional[Path]:
+            try:
+                return _resolve_path(explicit, **kwargs)
+            except FileNotFoundError as exc:
+                errors.append(str(exc))
+                return None
 
-        emulator = _resolve_path(
+        emulator = resolve(
             emulator_path,
             env_var=_ENV_EMULATOR_PATH,
             description=f"{emulator_description} executable",
         )
-        rom = _resolve_path(
+        rom = resolve(
             rom_path,
             env_var=_ENV_ROM_PATH,
             description="Pokémon Fire Red ROM",
         )
-        script = _resolve_path(
+        script = resolve(
             lua_script,
             env_var=_ENV_LUA_SCRIPT,
             description="Lua automation script",
             base_directory=root / "gba_automation" / "lua",
         )
 
+        if errors:
+            raise FileNotFoundError("\n".join(errors))
+        assert emulator is not None and rom is not None and script is not None
+
         return cls(emulator_path=emulator, rom_path=rom, lua_script=script)
 
 
@@ -93,11 +109,12 @@ def _resolve_path(
             f"No path configured for the {description}. Set '{env_var}' or pass an argument."
         )
 
-    path = Path(candidate)
+    path = Path(candidate).expanduser()
     if not path.is_absolute() and base_directory is not None:
         path = base_directory / path
 
-    path = path.expanduser().resolve()
+    # ``abspath`` normalises lexically; ``resolve`` would stat every path component.
+    path = Path(os.path.abspath(path))
     if not path.exists():
         raise FileNotFoundError(f"Configured {description} path does not exist: {path}")
 
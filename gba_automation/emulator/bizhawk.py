@@ -62,7 +62,8 @@ class BizHawkLauncher:
         """
 
         command = self.build_command(rom_path=rom_path, lua_script=lua_script, extra_args=extra_args)
-        _LOGGER.info("Launching BizHawk: %s", " ".join(shlex.quote(part) for part in command))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Launching BizHawk: %s", shlex.join(command))
 
         process = subprocess.Popen(command)
         if wait:
@@ -19,13 +19,13 @@ class LuaScriptRegistry:
     """Registry responsible for locating Lua automation scripts."""
 
     def __init__(self, base_directory: Path) -> None:
-        self._base_directory = base_directory
+        self._base_directory = base_directory.resolve()
         self._scripts: Dict[str, LuaScript] = {}
 
     def register(self, name: str, relative_path: str) -> None:
         """Register a script relative to the base directory."""
 
-        path = (self._base_directory / relative_path).resolve()
+        path = self._base_directory / relative_path
         self._scripts[name] = LuaScript(name=name, path=path)
 
     def get(self, name: str) -> LuaScript: